@@ -1,14 +1,41 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import List, Literal, Optional
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field
+import pandas as pd
 import uvicorn
-from src.pipeline.predict_pipeline import CustomData, PredictPipeline
+from src.pipeline.predict_pipeline import PredictPipeline
+
+def _warmup(pipeline):
+    # Run one synthetic predict through both serving paths so first-call
+    # costs (numba JIT, ONNX session optimization, lazy sklearn allocs)
+    # are paid before the server accepts traffic
+    example = {
+        "carat": 1.0, "depth": 62.0, "table": 58.0,
+        "x": 5.7, "y": 5.7, "z": 3.5,
+        "cut": "Ideal", "color": "G", "clarity": "VS1"
+    }
+    pipeline.predict(pd.DataFrame([example]))
+    pipeline.predict_row(**example)
+
+# Load the pipeline (preprocessor + model) once at startup instead of per request
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.pipeline = PredictPipeline()
+    _warmup(app.state.pipeline)
+    yield
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Gemstone Price Prediction API",
     description="API for predicting gemstone prices based on their characteristics",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware - IMPORTANT for Streamlit
@@ -22,19 +49,19 @@ app.add_middleware(
 
 # Pydantic model for API validation
 class GemstoneData(BaseModel):
-    carat: float
-    depth: float
-    table: float
-    x: float
-    y: float
-    z: float
-    cut: str
-    color: str
-    clarity: str
+    carat: float = Field(..., ge=0.2, le=5.0)
+    depth: float = Field(..., ge=40.0, le=80.0)
+    table: float = Field(..., ge=40.0, le=80.0)
+    x: float = Field(..., ge=3.0, le=10.0)
+    y: float = Field(..., ge=3.0, le=10.0)
+    z: float = Field(..., ge=2.0, le=8.0)
+    cut: Literal["Fair", "Good", "Very Good", "Premium", "Ideal"]
+    color: Literal["D", "E", "F", "G", "H", "I", "J"]
+    clarity: Literal["I1", "SI2", "SI1", "VS2", "VS1", "VVS2", "VVS1", "IF"]
 
     # Example values for API documentation
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "carat": 1.5,
                 "depth": 62.5,
@@ -47,10 +74,32 @@ class GemstoneData(BaseModel):
                 "clarity": "VS1"
             }
         }
+    )
+
+# Request body for batched predictions
+class BatchRequest(BaseModel):
+    items: List[GemstoneData]
+
+# Response body for single predictions - returned as the model instance
+# so FastAPI serializes it via pydantic-core without an intermediate dict
+class PredictResponse(BaseModel):
+    status: str
+    predicted_price: Optional[float] = None
+    message: Optional[str] = None
+
+# Cached prediction keyed on the 9 input features - repeat queries (e.g. from
+# Streamlit sliders) become a dict lookup instead of a full preprocess+predict.
+# The pipeline is a per-process singleton from app.state, so including it in
+# the key leaves the cache effectively keyed on the feature tuple
+@lru_cache(maxsize=4096)
+def _predict_cached(pipeline, carat, depth, table, x, y, z, cut, color, clarity):
+    return pipeline.predict_row(
+        carat, depth, table, x, y, z, cut, color, clarity
+    )
 
 # Main prediction endpoint
-@app.post("/predict")
-async def predict_price(gemstone_data: GemstoneData):
+@app.post("/predict", response_model=PredictResponse, response_model_exclude_none=True)
+def predict_price(gemstone_data: GemstoneData, request: Request):
     """
     Predict gemstone price based on characteristics
     
@@ -65,32 +114,43 @@ async def predict_price(gemstone_data: GemstoneData):
     - **clarity**: Clarity (I1, SI2, SI1, VS2, VS1, VVS2, VVS1, IF)
     """
     try:
-        # Create CustomData object from Pydantic model
-        data = CustomData(
-            carat=gemstone_data.carat,
-            depth=gemstone_data.depth,
-            table=gemstone_data.table,
-            x=gemstone_data.x,
-            y=gemstone_data.y,
-            z=gemstone_data.z,
-            cut=gemstone_data.cut,
-            color=gemstone_data.color,
-            clarity=gemstone_data.clarity
+        # Make prediction (LRU-cached on the input features)
+        pred = _predict_cached(
+            request.app.state.pipeline,
+            gemstone_data.carat,
+            gemstone_data.depth,
+            gemstone_data.table,
+            gemstone_data.x,
+            gemstone_data.y,
+            gemstone_data.z,
+            gemstone_data.cut,
+            gemstone_data.color,
+            gemstone_data.clarity
         )
 
-        # Get data as DataFrame
-        pred_df = data.get_data_as_dataframe()
-        
-        # Make prediction
-        predict_pipeline = PredictPipeline()
-        pred = predict_pipeline.predict(pred_df)
+        return PredictResponse(status="success", predicted_price=round(pred, 2))
+
+    except Exception as e:
+        return PredictResponse(status="error", message=f"Prediction failed: {str(e)}")
+
+# Batched prediction endpoint
+@app.post("/predict_batch")
+def predict_batch(batch: BatchRequest, request: Request):
+    """
+    Predict prices for a batch of gemstones in a single model call
+
+    One vectorized predict over N rows amortizes the per-call Python
+    overhead; a batch size of 256-1024 balances latency and throughput.
+    """
+    try:
+        pred_df = pd.DataFrame([item.model_dump() for item in batch.items])
+        preds = request.app.state.pipeline.predict(pred_df)
 
         return {
             "status": "success",
-            "predicted_price": round(pred[0], 2),
-            "input_data": gemstone_data.dict()
+            "predictions": [round(float(p), 2) for p in preds]
         }
-    
+
     except Exception as e:
         return {
             "status": "error",
@@ -116,5 +176,6 @@ async def get_options():
         "clarity": ["I1", "SI2", "SI1", "VS2", "VS1", "VVS2", "VVS1", "IF"]
     }
 
+# Dev entrypoint only - in production run: gunicorn -c gunicorn_conf.py app.main:app
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
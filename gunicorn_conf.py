@@ -0,0 +1,17 @@
+import multiprocessing
+
+# Gunicorn configuration for serving the FastAPI app in production:
+# gunicorn -c gunicorn_conf.py app.main:app
+bind = "0.0.0.0:8000"
+workers = multiprocessing.cpu_count() * 2 + 1
+
+# UvicornWorker picks up uvloop and httptools automatically when they
+# are installed (see requirements.txt), replacing the default asyncio
+# loop and pure-Python HTTP parser
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Import the app module once in the master so forked workers share its
+# code/import state. The model artifacts themselves load per worker in
+# the FastAPI lifespan (which runs after fork); their memory is shared
+# via the mmap_mode='r' loading in PredictPipeline, not via preload
+preload_app = True
@@ -1,26 +1,142 @@
+import os
 import sys
+import numpy as np
 import pandas as pd
 from src.exception import CustomException
 from src.logger import logging
 from src.utils import load_object
 
+def _assemble_features(nums, cat_codes, num_mean, num_scale, cat_mean, cat_scale):
+    '''
+    Scale the 6 numeric values and 3 ordinal codes into one feature row
+    '''
+    row = np.empty(9, dtype=np.float64)
+    for i in range(6):
+        row[i] = (nums[i] - num_mean[i]) / num_scale[i]
+    for i in range(3):
+        row[6 + i] = (cat_codes[i] - cat_mean[i]) / cat_scale[i]
+    return row
+
+# JIT-compile the scaling kernel when numba is available; the plain
+# NumPy version above is used otherwise. The signature is frozen to the
+# fixed 9-feature shape so numba compiles eagerly at import time (no
+# first-request JIT pause) and skips runtime dtype dispatch. The fitted
+# mean/scale constants are declared readonly because they come from
+# artifacts loaded with mmap_mode='r', whose arrays are not writable
+try:
+    from numba import njit, types
+    _readonly_row = types.Array(types.float64, 1, 'C', readonly=True)
+    _assemble_features = njit(
+        types.float64[::1](
+            types.float64[::1], types.float64[::1],
+            _readonly_row, _readonly_row, _readonly_row, _readonly_row
+        ),
+        cache=True,
+        fastmath=True
+    )(_assemble_features)
+except ImportError:
+    pass
+
 class PredictPipeline:
     def __init__(self):
-        pass
-
-    def predict(self, features):
         try:
             preprocessor_path = 'artifacts/preprocessor.pkl'
             model_path = 'artifacts/model.pkl'
-            preprocessor = load_object(file_path=preprocessor_path)
-            model = load_object(file_path=model_path)
-            data_scaled = preprocessor.transform(features)
-            pred = model.predict(data_scaled)
+            self.preprocessor = load_object(file_path=preprocessor_path, mmap_mode='r')
+
+            # Prefer an exported ONNX model (see export_onnx.py) when both
+            # the file and onnxruntime are available - int8 quantized
+            # first, then float32 - otherwise fall back to the pickled
+            # sklearn model
+            self.model = None
+            self.onnx_session = self._create_onnx_session('artifacts/model.int8.onnx')
+            if self.onnx_session is None:
+                self.onnx_session = self._create_onnx_session('artifacts/model.onnx')
+            if self.onnx_session is None:
+                self.model = load_object(file_path=model_path, mmap_mode='r')
+
+            # Pull the fitted scaler/encoder constants out of the preprocessor
+            # so single rows can be encoded without building a DataFrame
+            num_pipeline = self.preprocessor.named_transformers_['num_pipeline']
+            cat_pipeline = self.preprocessor.named_transformers_['cat_pipeline']
+            num_scaler = num_pipeline.named_steps['scaler']
+            cat_scaler = cat_pipeline.named_steps['scaler']
+            ordinal_encoder = cat_pipeline.named_steps['ordinal_encoder']
+
+            self.num_mean = np.asarray(num_scaler.mean_)
+            self.num_scale = np.asarray(num_scaler.scale_)
+            self.cat_mean = np.asarray(cat_scaler.mean_)
+            self.cat_scale = np.asarray(cat_scaler.scale_)
+            self.cat_maps = [
+                {category: code for code, category in enumerate(categories)}
+                for categories in ordinal_encoder.categories_
+            ]
+            logging.info('Preprocessor and model loaded into memory')
+        except Exception as e:
+            logging.info('Exception occured while loading artifacts in prediction pipeline')
+            raise CustomException(e,sys)
+
+    def _create_onnx_session(self, onnx_path):
+        if not os.path.exists(onnx_path):
+            return None
+        try:
+            import onnxruntime as ort
+        except ImportError:
+            logging.info('onnxruntime not installed, using pickled model')
+            return None
+        sess_options = ort.SessionOptions()
+        sess_options.intra_op_num_threads = 1
+        sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        session = ort.InferenceSession(
+            onnx_path,
+            sess_options=sess_options,
+            providers=['CPUExecutionProvider']
+        )
+        logging.info(f'ONNX session created from {onnx_path}')
+        return session
+
+    def _model_predict(self, data_scaled):
+        if self.onnx_session is not None:
+            data_scaled = np.asarray(data_scaled, dtype=np.float32).reshape(-1, 9)
+            return self.onnx_session.run(None, {'X': data_scaled})[0].ravel()
+        return self.model.predict(data_scaled)
+
+    def predict(self, features):
+        try:
+            data_scaled = self.preprocessor.transform(features)
+            pred = self._model_predict(data_scaled)
             return pred
         except Exception as e:
             logging.info('Exception occured in prediction pipeline')
             raise CustomException(e,sys)
-        
+
+    def predict_row(self, carat, depth, table, x, y, z, cut, color, clarity):
+        '''
+        Predict the price of a single gemstone without building a DataFrame
+
+        Applies the fitted preprocessing manually (ordinal encode the
+        categoricals, standard-scale everything) and feeds the model a
+        single preallocated row - much cheaper than pd.DataFrame for
+        one-row API requests
+        '''
+        try:
+            nums = np.array([carat, depth, table, x, y, z], dtype=np.float64)
+            cat_codes = np.array([
+                self.cat_maps[0][cut],
+                self.cat_maps[1][color],
+                self.cat_maps[2][clarity]
+            ], dtype=np.float64)
+            row = _assemble_features(
+                nums, cat_codes,
+                self.num_mean, self.num_scale,
+                self.cat_mean, self.cat_scale
+            )
+            pred = self._model_predict(row.reshape(1, -1))
+            return float(pred[0])
+        except Exception as e:
+            logging.info('Exception occured in predict_row of prediction pipeline')
+            raise CustomException(e,sys)
+
 
 class CustomData:
     def __init__(self,
@@ -1,9 +1,9 @@
 import os
 import sys
 
-import numpy as np 
+import numpy as np
 import pandas as pd
-import dill
+import joblib
 from sklearn.metrics import r2_score, mean_absolute_error, mean_squared_error
 
 from src.exception import CustomException
@@ -15,8 +15,9 @@ def save_object(file_path, obj):
 
         os.makedirs(dir_path, exist_ok=True)
 
-        with open(file_path, "wb") as file_obj:
-            dill.dump(obj, file_obj)
+        # compress=0 stores NumPy arrays as raw npy blocks, which keeps
+        # them memory-mappable when loaded with mmap_mode
+        joblib.dump(obj, file_path, compress=0)
 
     except Exception as e:
         raise CustomException(e, sys)
@@ -85,10 +86,12 @@ def print_evaluated_results(xtrain,ytrain,xtest,ytest,model):
         logging.info('Exception occured during printing of evaluated results')
         raise CustomException(e,sys)
     
-def load_object(file_path):
+def load_object(file_path, mmap_mode=None):
     try:
-        with open(file_path,'rb') as file_obj:
-            return dill.load(file_obj)
+        # mmap_mode='r' maps joblib-saved arrays instead of copying them,
+        # so forked gunicorn workers share the pages; plain pickles saved
+        # by older versions still load (mmap_mode is ignored for them)
+        return joblib.load(file_path, mmap_mode=mmap_mode)
     except Exception as e:
         logging.info('Exception Occured in load_object function utils')
         raise CustomException(e,sys)
\ No newline at end of file
@@ -1,5 +1,5 @@
 import streamlit as st
-import requests
+import httpx
 import json
 
 # Configure the page
@@ -43,15 +43,46 @@ st.markdown("""
 # API configuration
 API_URL = "http://localhost:8000"  # Change if deployed
 
+@st.cache_resource
+def get_client():
+    """Create a pooled httpx client reused across reruns (keep-alive + HTTP/2)"""
+    return httpx.Client(
+        base_url=API_URL,
+        http2=True,
+        timeout=5.0,
+        limits=httpx.Limits(max_keepalive_connections=10, max_connections=10)
+    )
+
+@st.cache_data(ttl=10)
+def check_api_health():
+    """Probe the API health endpoint at most once every 10s"""
+    return get_client().get("/health", timeout=2).status_code
+
+@st.cache_data(ttl=3600)
+def get_options():
+    """Fetch categorical options from the API, falling back to known defaults"""
+    defaults = {
+        "cut": ["Ideal", "Premium", "Very Good", "Good", "Fair"],
+        "color": ["D", "E", "F", "G", "H", "I", "J"],
+        "clarity": ["IF", "VVS1", "VVS2", "VS1", "VS2", "SI1", "SI2", "I1"]
+    }
+    try:
+        response = get_client().get("/options", timeout=2)
+        if response.status_code == 200:
+            return response.json()
+    except httpx.HTTPError:
+        pass
+    return defaults
+
 def predict_price(data):
     """Send prediction request to FastAPI backend"""
     try:
-        response = requests.post(f"{API_URL}/predict", json=data)
+        response = get_client().post("/predict", json=data)
         if response.status_code == 200:
             return response.json()
         else:
             return {"status": "error", "message": f"API Error: {response.status_code}"}
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         return {"status": "error", "message": f"Connection error: {str(e)}"}
 
 def main():
@@ -75,9 +106,10 @@ def main():
     
     with col3:
         st.subheader("💎 Quality Grades")
-        cut = st.selectbox("Cut Quality", ["Ideal", "Premium", "Very Good", "Good", "Fair"])
-        color = st.selectbox("Color Grade", ["D", "E", "F", "G", "H", "I", "J"])
-        clarity = st.selectbox("Clarity", ["IF", "VVS1", "VVS2", "VS1", "VS2", "SI1", "SI2", "I1"])
+        options = get_options()
+        cut = st.selectbox("Cut Quality", options["cut"])
+        color = st.selectbox("Color Grade", options["color"])
+        clarity = st.selectbox("Clarity", options["clarity"])
     
     # API status check (moved from sidebar)
     st.markdown("---")
@@ -85,8 +117,7 @@ def main():
     
     with col_status2:
         try:
-            response = requests.get(f"{API_URL}/health")
-            if response.status_code == 200:
+            if check_api_health() == 200:
                 st.success("✅ API Connected")
             else:
                 st.error("❌ API Failed")